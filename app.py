@@ -1,11 +1,265 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox
+import fnmatch
+import multiprocessing
 import os
 import queue
+import re
 import threading
-from typing import Optional, List, Tuple
+from collections import deque
+from itertools import islice
+from operator import attrgetter, itemgetter
+from concurrent.futures import ThreadPoolExecutor, wait
+from multiprocessing.synchronize import Event
+from typing import Generator, Iterable, Optional, List, Pattern, Tuple
 from pathlib import Path
 
+# Tree drawing pieces: the branch in front of an entry, and the column an
+# entry contributes to its children's prefix
+BRANCH_MID = "├── "
+BRANCH_LAST = "└── "
+INDENT_MID = "│   "
+INDENT_LAST = "    "
+
+# Number of tree lines the worker batches into a single output chunk
+OUTPUT_CHUNK_LINES = 512
+
+# Delay between UI drains of worker output (~one frame at 60 Hz)
+MONITOR_INTERVAL_MS = 16
+
+# Upper bound on chunks inserted per drain (8 x 512 = 4096 lines)
+MAX_CHUNKS_PER_TICK = 8
+
+# Minimum delay between automatic scrolls to the end of the results
+AUTOSCROLL_INTERVAL_MS = 100
+
+# Lines shown in the results view before the rest is kept only for copying
+MAX_DISPLAY_LINES = 50000
+
+# Number of threads reading directories concurrently during a search
+SCAN_WORKERS = 8
+
+# Directories, nearest first, whose listings are requested ahead of the walk
+READ_AHEAD = 2 * SCAN_WORKERS
+
+# Seconds between stop checks while the walk waits for a listing
+STOP_POLL_SECONDS = 0.1
+
+# Start method for the walker process; fork from a threaded Tk process can
+# deadlock the child, so it always starts fresh
+SCAN_CONTEXT = multiprocessing.get_context("spawn")
+
+# Characters that make an ignore entry a glob pattern rather than a plain name;
+# "[" alone doesn't, so names like "[old]" keep matching literally
+GLOB_CHARS = frozenset('*?')
+
+def compile_ignore_patterns(patterns: Iterable[str]) -> Tuple[Optional[Pattern], Optional[Pattern]]:
+    """
+    Compile ignore entries into (folder_glob_regex, file_regex), either may be None.
+    
+    Plain entries match folders by exact name and files by substring; entries
+    with * or ? match whole names of both, like fnmatch (including [...] and
+    ignoring case on Windows).
+    """
+    folder_globs = []
+    file_rules = []
+    for pattern in patterns:
+        if GLOB_CHARS.intersection(pattern):
+            glob = fnmatch.translate(pattern)
+            if os.name == "nt":
+                glob = f"(?i:{glob})"  # fnmatch normalizes case there
+            folder_globs.append(glob)
+            file_rules.append(glob)
+        else:
+            file_rules.append(f"(?s:.*{re.escape(pattern)})")
+    
+    folder_re = re.compile("|".join(folder_globs)) if folder_globs else None
+    file_re = re.compile("|".join(file_rules)) if file_rules else None
+    return folder_re, file_re
+
+def list_directory(path: str, ignored_folders: frozenset, ignored_folder_re: Optional[Pattern],
+                   ignore_hidden: bool, include_files: bool,
+                   include_dirs: bool = True) -> Tuple[List[os.DirEntry], List[str]]:
+    """
+    Read a directory and return its sorted (subdirectory entries, file names).
+    
+    Ignored and hidden entries are dropped; include_files and include_dirs
+    False leave the corresponding list empty.
+    """
+    dirs = []
+    files = []
+    with os.scandir(path) as it:
+        for entry in it:
+            name = entry.name
+            if name in ignored_folders:
+                continue
+            if ignore_hidden and name.startswith('.'):
+                continue
+            if ignored_folder_re is not None and ignored_folder_re.match(name):
+                continue
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                # Type unknown; list it as a file like os.walk
+                is_dir = False
+            if is_dir:
+                if include_dirs:
+                    dirs.append(entry)
+            elif include_files:
+                files.append(name)
+    dirs.sort(key=attrgetter('name'))
+    files.sort()
+    return dirs, files
+
+def entry_inode(entry: os.DirEntry) -> int:
+    """Return the entry's inode number, or 0 if it can't be read."""
+    try:
+        return entry.inode()
+    except OSError:
+        return 0  # Windows stats for it; the entry may already be gone
+
+def walk_tree(start_dir: str, max_depth: int, show_option: str, ignored_folders: frozenset,
+              ignore_hidden: bool, stop_event: Event,
+              inode_order: bool = False) -> Generator[str, None, int]:
+    """
+    Walk the tree depth-first, yielding chunks of about OUTPUT_CHUNK_LINES lines.
+    
+    Returns the number of files listed. With inode_order, listings requested
+    together are read in inode order; the output order is the same either way.
+    """
+    # The next READ_AHEAD directories on the stack are read ahead on a thread
+    # pool. Stack frames are [listing, path, inode, include_dirs, name, depth,
+    # prefix, is_last]; listing stays None until the frame enters the window,
+    # and for good when nothing inside the directory is shown.
+    start_dir = os.path.normpath(start_dir)
+    stop_is_set = stop_event.is_set
+    ignored_folder_re, ignored_file_re = compile_ignore_patterns(ignored_folders)
+    ignored_file_match = ignored_file_re.match if ignored_file_re is not None else None
+    executor = ThreadPoolExecutor(max_workers=SCAN_WORKERS)
+    submit = executor.submit
+    scan = list_directory
+    include_files = show_option in ["both", "files"]
+    stack = deque([[None, start_dir, 0, max_depth != 0, os.path.basename(start_dir), 0, "", True]])
+    pop = stack.pop
+    buf = []
+    add_line = buf.append
+    items = 0
+    try:
+        while stack:
+            if stop_is_set():
+                break
+            
+            # Fill the read-ahead window; the directory needed next is nearest
+            # the top, so its read is never queued behind the rest of the tree
+            batch = [frame for frame in islice(reversed(stack), READ_AHEAD)
+                     if frame[0] is None and (include_files or frame[3])]
+            if inode_order:
+                batch.sort(key=itemgetter(2))
+            for frame in batch:
+                frame[0] = submit(scan, frame[1], ignored_folders, ignored_folder_re, ignore_hidden,
+                                  include_files, frame[3])
+            
+            listing, _, _, _, name, depth, prefix, is_last = pop()
+            
+            if listing is None:
+                # Nothing inside is shown, so the directory was never read
+                dirs, files = [], []
+            else:
+                if not listing.done():
+                    # Hand over finished lines before blocking on the read
+                    if buf:
+                        yield "".join(buf)
+                        buf.clear()
+                    while not listing.done() and not stop_is_set():
+                        wait((listing,), timeout=STOP_POLL_SECONDS)
+                    if not listing.done():
+                        break  # Stopped while waiting
+                try:
+                    dirs, files = listing.result()
+                except OSError:
+                    if depth == 0:
+                        raise  # Reported by scan_process, e.g. not found or denied
+                    # Keep the line so the siblings' branches still connect
+                    add_line(f"{prefix}{BRANCH_LAST if is_last else BRANCH_MID}{name}/ [error opening dir]\n")
+                    continue
+            
+            # Children inherit the ancestor prefix plus one column for this directory
+            if depth == 0:
+                add_line(f"{name}/\n")
+                child_prefix = ""
+            else:
+                add_line(f"{prefix}{BRANCH_LAST if is_last else BRANCH_MID}{name}/\n")
+                child_prefix = prefix + (INDENT_LAST if is_last else INDENT_MID)
+            
+            # Process files in this directory
+            if include_files:
+                # Substring ignores; the rest were applied by list_directory
+                if ignored_file_match is not None:
+                    filtered_files = [f for f in files if not ignored_file_match(f)]
+                else:
+                    filtered_files = files
+                
+                # Subfolders follow the files, so the last file only closes
+                # the branch when there are none
+                last_file = len(filtered_files) - 1 if not dirs else -1
+                for i, file_name in enumerate(filtered_files):
+                    file_prefix = BRANCH_LAST if i == last_file else BRANCH_MID
+                    add_line(f"{child_prefix}{file_prefix}{file_name}\n")
+                    if len(buf) >= OUTPUT_CHUNK_LINES:
+                        yield "".join(buf)
+                        buf.clear()
+                items += len(filtered_files)
+            
+            if len(buf) >= OUTPUT_CHUNK_LINES:
+                yield "".join(buf)
+                buf.clear()
+            
+            # Subdirectories past the depth limit are not listed
+            if max_depth >= 0 and depth + 1 > max_depth:
+                continue
+            # Children sitting at the limit are shown without their subfolders
+            child_dirs = max_depth < 0 or depth + 2 <= max_depth
+            
+            # Push subdirectories in reverse so they are popped in sorted order
+            last_index = len(dirs) - 1
+            children = []
+            for i, entry in enumerate(dirs):
+                children.append([None, entry.path, entry_inode(entry) if inode_order else 0, child_dirs,
+                                 entry.name, depth + 1, child_prefix, i == last_index])
+            stack.extend(reversed(children))
+    finally:
+        # Drop listings still queued when the walk stops early
+        for pending in stack:
+            if pending[0] is not None:
+                pending[0].cancel()
+        executor.shutdown(wait=False)
+    
+    if buf:
+        yield "".join(buf)
+    return items
+
+def scan_process(start_dir: str, max_depth: int, show_option: str, ignored_folders: frozenset,
+                 ignore_hidden: bool, inode_order: bool, stop_event: Event,
+                 results: "multiprocessing.Queue") -> None:
+    """
+    Walk the tree in a child process and send its chunks to results.
+    
+    The last message is the listed-file count, or None after an error line.
+    """
+    chunks = walk_tree(start_dir, max_depth, show_option, ignored_folders, ignore_hidden, stop_event,
+                       inode_order)
+    try:
+        while True:
+            results.put(next(chunks))
+    except StopIteration as finished:
+        results.put(finished.value)
+    except FileNotFoundError:
+        results.put(f"Error: Directory not found - {start_dir}\n")
+        results.put(None)
+    except Exception as e:
+        results.put(f"Error: {str(e)}\n")
+        results.put(None)
+
 # Configure ttk styles
 def configure_styles():
     """Configure modern ttk styles for a beautiful UI."""
@@ -77,11 +331,20 @@ class DirectoryTreeApp:
         # Configure modern styling
         configure_styles()
         
-        # Threading control
-        self.stop_event = threading.Event()
+        # Search control; stop_event is shared with the walker process
+        self.stop_event = SCAN_CONTEXT.Event()
         self.search_thread: Optional[threading.Thread] = None
-        self.queue = queue.Queue()
+        # Chunks handed from the relay thread to the Tk loop
+        self.output_chunks = deque()
+        self.search_done = threading.Event()
+        self.search_finished = threading.Event()  # Relay thread has exited
         self.items_processed = 0
+        # Read end of the pipe the relay thread signals on each chunk
+        self.wake_fd: Optional[int] = None
+        self.monitor_id: Optional[str] = None  # Pending monitor_search timer
+        
+        # Full search output; the Text widget shows at most MAX_DISPLAY_LINES
+        self.reset_result_buffer()
         
         # Folder ignore functionality
         self.ignored_folders = set()
@@ -89,7 +352,11 @@ class DirectoryTreeApp:
         
         # UI state
         self.options_expanded = False
+        self.progress_reset_id: Optional[str] = None  # Pending "Ready" reset
+        self.autoscroll_pending = False  # A deferred see(END) is scheduled
         self.ignore_hidden = tk.BooleanVar(value=True)  # Default to ignore hidden files
+        # Read subfolders in inode order; on by default where inode() is free
+        self.inode_order = tk.BooleanVar(value=os.name != "nt")
         
         self.setup_ui()
     
@@ -129,8 +396,7 @@ class DirectoryTreeApp:
             self.ignore_listbox.delete(0, tk.END)
             for pattern in sorted(self.ignored_folders):
                 self.ignore_listbox.insert(tk.END, pattern)
-            self.progress_var.set("Loaded default ignore patterns")
-            self.root.after(2000, lambda: self.progress_var.set("Ready"))
+            self.flash_status("Loaded default ignore patterns")
         
     def setup_ui(self) -> None:
         """Set up the user interface."""
@@ -223,6 +489,9 @@ class DirectoryTreeApp:
         ttk.Checkbutton(hidden_frame, text="Ignore Hidden", 
                        variable=self.ignore_hidden, 
                        style='Secondary.TCheckbutton').pack(side=tk.LEFT)
+        ttk.Checkbutton(hidden_frame, text="Inode Order", 
+                       variable=self.inode_order, 
+                       style='Secondary.TCheckbutton').pack(side=tk.LEFT, padx=(8, 0))
         
         # Ignore folders (compact)
         ignore_frame = ttk.Frame(options_row)
@@ -285,7 +554,7 @@ class DirectoryTreeApp:
                                       style='Card.TLabelframe', padding=5)
         results_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        # Text area with custom styling
+        # Text area with custom styling; read-only, without undo
         self.text_area = scrolledtext.ScrolledText(
             results_frame, 
             wrap=tk.NONE,
@@ -296,7 +565,11 @@ class DirectoryTreeApp:
             borderwidth=1,
             selectbackground="#3498db",
             selectforeground="white",
-            insertbackground="#2c3e50"
+            insertbackground="#2c3e50",
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+            state=tk.DISABLED
         )
         self.text_area.pack(fill=tk.BOTH, expand=True)
         
@@ -333,8 +606,34 @@ class DirectoryTreeApp:
     
     def clear_results(self) -> None:
         """Clear the results text area."""
+        self.text_area.configure(state=tk.NORMAL)
         self.text_area.delete(1.0, tk.END)
+        self.text_area.configure(state=tk.DISABLED)
+        self.reset_result_buffer()
         self.stats_var.set("")
+        self.set_status("Ready")
+    
+    def reset_result_buffer(self) -> None:
+        """Forget the buffered results and the display line count."""
+        self.result_chunks = []
+        self.displayed_lines = 0
+        self.hidden_lines = 0
+    
+    def set_status(self, message: str) -> None:
+        """Show a status message, cancelling any pending reset to "Ready"."""
+        if self.progress_reset_id is not None:
+            self.root.after_cancel(self.progress_reset_id)
+            self.progress_reset_id = None
+        self.progress_var.set(message)
+    
+    def flash_status(self, message: str) -> None:
+        """Show a status message and reset it to "Ready" after two seconds."""
+        self.set_status(message)
+        self.progress_reset_id = self.root.after(2000, self.reset_status)
+    
+    def reset_status(self) -> None:
+        """Restore the idle status message."""
+        self.progress_reset_id = None
         self.progress_var.set("Ready")
     
     def add_ignore_folder(self) -> None:
@@ -345,11 +644,9 @@ class DirectoryTreeApp:
                 self.ignored_folders.add(folder_name)
                 self.ignore_listbox.insert(tk.END, folder_name)
                 self.ignore_entry.delete(0, tk.END)
-                self.progress_var.set(f"Added '{folder_name}' to ignore list")
-                self.root.after(2000, lambda: self.progress_var.set("Ready"))
+                self.flash_status(f"Added '{folder_name}' to ignore list")
             else:
-                self.progress_var.set(f"'{folder_name}' is already in ignore list")
-                self.root.after(2000, lambda: self.progress_var.set("Ready"))
+                self.flash_status(f"'{folder_name}' is already in ignore list")
     
     def remove_ignore_folder(self) -> None:
         """Remove selected folder from ignore list."""
@@ -359,15 +656,13 @@ class DirectoryTreeApp:
             folder_name = self.ignore_listbox.get(index)
             self.ignored_folders.discard(folder_name)
             self.ignore_listbox.delete(index)
-            self.progress_var.set(f"Removed '{folder_name}' from ignore list")
-            self.root.after(2000, lambda: self.progress_var.set("Ready"))
+            self.flash_status(f"Removed '{folder_name}' from ignore list")
     
     def clear_ignore_folders(self) -> None:
         """Clear all ignored folders."""
         self.ignored_folders.clear()
         self.ignore_listbox.delete(0, tk.END)
-        self.progress_var.set("Cleared all ignored folders")
-        self.root.after(2000, lambda: self.progress_var.set("Ready"))
+        self.flash_status("Cleared all ignored folders")
     
     def toggle_search(self) -> None:
         """Toggle search operation (start/stop)."""
@@ -375,7 +670,7 @@ class DirectoryTreeApp:
             self.stop_event.set()
             self.search_btn.config(text="Generate Tree")
             self.progress_bar.stop()
-            self.progress_var.set("Stopping...")
+            self.set_status("Stopping...")
         else:
             self.start_search()
     
@@ -392,8 +687,15 @@ class DirectoryTreeApp:
             return
         
         # Clear previous results
+        self.text_area.configure(state=tk.NORMAL)
         self.text_area.delete(1.0, tk.END)
-        self.stop_event.clear()
+        self.text_area.configure(state=tk.DISABLED)
+        # A fresh stop flag per search, so a stopping walker stays stopped
+        self.stop_event = SCAN_CONTEXT.Event()
+        self.search_done.clear()
+        self.search_finished.clear()
+        self.output_chunks.clear()
+        self.reset_result_buffer()
         self.items_processed = 0
         
         # Get parameters
@@ -402,183 +704,201 @@ class DirectoryTreeApp:
         except ValueError:
             max_depth = -1
         show_option = self.show_option.get()
+        # Snapshot the ignore list so the worker never sees it change mid-scan
+        ignored = frozenset(self.ignored_folders)
         
-        # Start search thread
+        # Start search thread (it launches and relays the walker process)
+        wake_fd = self.open_wake_pipe()
         self.search_thread = threading.Thread(
             target=self.search_directory,
-            args=(start_dir, max_depth, show_option, self.ignored_folders, self.ignore_hidden.get()),
+            args=(start_dir, max_depth, show_option, ignored, self.ignore_hidden.get(),
+                  self.inode_order.get(), wake_fd),
             daemon=True
         )
         self.search_thread.start()
         self.search_btn.config(text="Stop")
         self.progress_bar.start()
-        self.progress_var.set("Scanning directory...")
+        self.set_status("Scanning directory...")
         self.monitor_search()
     
-    def search_directory(self, start_dir: str, max_depth: int, show_option: str, ignored_folders: set, ignore_hidden: bool) -> None:
-        """Search directory and build tree structure."""
+    def open_wake_pipe(self) -> Optional[int]:
+        """Watch a new wake pipe from the Tk loop and return its write end."""
+        if self.monitor_id is not None:
+            self.root.after_cancel(self.monitor_id)
+            self.monitor_id = None
+        self.close_wake_pipe()
+        # Tk can only watch file descriptors on POSIX; elsewhere (Windows)
+        # monitor_search keeps polling with after()
+        if not hasattr(self.root.tk, "createfilehandler"):
+            return None
+        read_fd, write_fd = os.pipe()
+        # Non-blocking on both ends: a full pipe already means a wakeup is pending
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        self.root.tk.createfilehandler(read_fd, tk.READABLE, self.on_wake)
+        self.wake_fd = read_fd
+        return write_fd
+    
+    def close_wake_pipe(self) -> None:
+        """Stop watching the wake pipe and close its read end."""
+        if self.wake_fd is not None:
+            self.root.tk.deletefilehandler(self.wake_fd)
+            os.close(self.wake_fd)
+            self.wake_fd = None
+    
+    def on_wake(self, fd: int, mask: int) -> None:
+        """Drain output after the relay thread signals the wake pipe."""
         try:
-            if not os.path.isdir(start_dir):
-                self.queue.put(f"Error: Directory not found - {start_dir}")
-                return
-            
-            # Get all directory paths first to build proper tree structure
-            all_paths = []
-            for root, dirs, files in os.walk(start_dir):
-                if self.stop_event.is_set():
-                    break
-                
-                rel_path = os.path.relpath(root, start_dir)
-                depth = 0 if rel_path == "." else len(rel_path.split(os.sep))
-                
-                if max_depth >= 0 and depth > max_depth:
-                    continue
-                
-                # Filter out ignored folders and hidden folders
-                filtered_dirs = []
-                dirs_to_remove = []
-                for dir_name in dirs:
-                    should_ignore = False
-                    
-                    # Check if folder is in ignore list
-                    if dir_name in ignored_folders:
-                        should_ignore = True
-                    
-                    # Check if folder is hidden (starts with dot)
-                    if ignore_hidden and dir_name.startswith('.'):
-                        should_ignore = True
-                    
-                    if not should_ignore:
-                        filtered_dirs.append(dir_name)
-                    else:
-                        # Mark for removal from os.walk traversal
-                        dirs_to_remove.append(dir_name)
-                
-                # Remove ignored directories from os.walk traversal
-                for dir_name in dirs_to_remove:
-                    dirs.remove(dir_name)
-                
-                all_paths.append((root, depth, sorted(filtered_dirs), sorted(files)))
-            
-            # Build tree structure
-            self.queue.put(f"{os.path.basename(start_dir)}/")
-            
-            for root, depth, dirs, files in all_paths:
-                if self.stop_event.is_set():
-                    break
-                
-                if depth == 0:
-                    continue  # Skip root directory (already added)
-                
-                # Build path components for proper tree formatting
-                path_parts = os.path.relpath(root, start_dir).split(os.sep)
-                prefix_parts = []
-                
-                # Build prefix for each level
-                for i in range(depth):
-                    if i == depth - 1:
-                        # Last level - check if it's the last item
-                        is_last = True
-                        if i < len(path_parts) - 1:
-                            # Check if this is the last directory at this level
-                            parent_path = os.sep.join(path_parts[:i+1])
-                            parent_full_path = os.path.join(start_dir, parent_path)
-                            try:
-                                parent_contents = os.listdir(parent_full_path)
-                                dirs_in_parent = [d for d in parent_contents if os.path.isdir(os.path.join(parent_full_path, d))]
-                                if path_parts[i] in dirs_in_parent:
-                                    is_last = path_parts[i] == sorted(dirs_in_parent)[-1]
-                            except (OSError, PermissionError):
-                                is_last = True
-                        
-                        prefix_parts.append("└── " if is_last else "├── ")
-                    else:
-                        # Intermediate levels
-                        prefix_parts.append("│   ")
-                
-                prefix = "".join(prefix_parts)
-                dir_name = os.path.basename(root)
-                self.queue.put(f"{prefix}{dir_name}/")
-                
-                # Process files in this directory
-                if show_option in ["both", "files"]:
-                    # Filter files based on hidden files option and ignore patterns
-                    filtered_files = []
-                    for file_name in files:
-                        should_ignore = False
-                        
-                        # Check if file is hidden (starts with dot)
-                        if ignore_hidden and file_name.startswith('.'):
-                            should_ignore = True
-                        
-                        # Check if file matches any ignore pattern
-                        if not should_ignore:
-                            for pattern in ignored_folders:
-                                # Check if file name matches the pattern exactly
-                                if file_name == pattern:
-                                    should_ignore = True
-                                    break
-                                # Check if file extension matches the pattern
-                                if pattern.startswith('.') and file_name.endswith(pattern):
-                                    should_ignore = True
-                                    break
-                                # Check if file name contains the pattern (for partial matches)
-                                if pattern in file_name:
-                                    should_ignore = True
-                                    break
-                        
-                        if not should_ignore:
-                            filtered_files.append(file_name)
-                    
-                    for i, file_name in enumerate(filtered_files):
-                        if self.stop_event.is_set():
-                            break
-                        
-                        is_last_file = (i == len(filtered_files) - 1) and show_option != "both"
-                        file_prefix = "└── " if is_last_file else "├── "
-                        self.queue.put(f"{prefix}{file_prefix}{file_name}")
-                        self.items_processed += 1
-            
-            self.queue.put(None)  # Search complete signal
-            
-        except Exception as e:
-            self.queue.put(f"Error: {str(e)}")
+            os.read(fd, 4096)  # One read clears any number of queued wakeups
+        except BlockingIOError:
+            pass
+        # With a backlog timer pending, that timer keeps the drain paced
+        if self.monitor_id is None:
+            self.monitor_search()
     
-    def monitor_search(self) -> None:
-        """Monitor search progress and update UI."""
+    def search_directory(self, start_dir: str, max_depth: int, show_option: str, ignored_folders: frozenset, ignore_hidden: bool, inode_order: bool = False, wake_fd: Optional[int] = None) -> None:
+        """Run the walker in a child process and relay its output to the UI."""
+        results = SCAN_CONTEXT.Queue()
+        process = SCAN_CONTEXT.Process(
+            target=scan_process,
+            args=(start_dir, max_depth, show_option, ignored_folders, ignore_hidden,
+                  inode_order, self.stop_event, results),
+            daemon=True
+        )
+        process.start()
+        put = self.output_chunks.append
+        
+        def wake() -> None:
+            if wake_fd is not None:
+                try:
+                    os.write(wake_fd, b"\0")
+                except OSError:
+                    pass  # Pipe full (a wakeup is already pending) or UI stopped watching
+        
         try:
             while True:
-                # Process all available items in queue
                 try:
-                    item = self.queue.get_nowait()
-                    if item is None:  # Search complete
-                        self.search_btn.config(text="Generate Tree")
-                        self.progress_bar.stop()
-                        self.progress_var.set(f"Complete - {self.items_processed} items processed")
-                        self.stats_var.set(f"Items: {self.items_processed}")
-                        break
-                    self.text_area.insert(tk.END, item + "\n")
-                    self.text_area.see(tk.END)
+                    item = results.get(timeout=0.5)
                 except queue.Empty:
+                    if process.is_alive():
+                        continue
+                    # Exited without a terminal message (e.g. killed)
+                    try:
+                        item = results.get_nowait()
+                    except queue.Empty:
+                        break
+                
+                if isinstance(item, str):
+                    put(item)
+                    wake()
+                elif item is None:
+                    break  # Walker failed; its error chunk was already relayed
+                else:
+                    self.items_processed = item
+                    self.search_done.set()  # Search complete signal
                     break
+        finally:
+            process.join()
+            results.close()
+            self.search_finished.set()
+            wake()
+            if wake_fd is not None:
+                os.close(wake_fd)
+    
+    def monitor_search(self) -> None:
+        """Monitor search progress and update UI."""
+        self.monitor_id = None
+        try:
+            # Read the worker state before draining so the final chunk isn't missed
+            done = self.search_done.is_set()
+            running = not self.search_finished.is_set()
+            # Drain a bounded number of chunks per tick
+            batch = []
+            while self.output_chunks and len(batch) < MAX_CHUNKS_PER_TICK:
+                batch.append(self.output_chunks.popleft())
+            
+            if batch:
+                # Each item is a pre-joined chunk of newline-terminated lines
+                self.result_chunks.extend(batch)
+                self.display_lines("".join(batch))
+            
+            if self.output_chunks:
+                # Backlog left over; keep draining on the next tick
+                self.monitor_id = self.root.after(MONITOR_INTERVAL_MS, self.monitor_search)
+                return
+            
+            if done:
+                self.close_wake_pipe()
+                self.search_btn.config(text="Generate Tree")
+                self.progress_bar.stop()
+                self.show_truncation_note()
+                self.set_status(f"Complete - {self.items_processed} items processed")
+                self.stats_var.set(f"Items: {self.items_processed}")
+                return
             
             # Check if thread is still running
-            if self.search_thread and self.search_thread.is_alive():
-                self.root.after(100, self.monitor_search)
+            if running:
+                if self.wake_fd is None:
+                    # No wake pipe on this platform; poll for the next chunk
+                    self.monitor_id = self.root.after(MONITOR_INTERVAL_MS, self.monitor_search)
             else:
+                self.close_wake_pipe()
                 self.search_btn.config(text="Generate Tree")
                 self.progress_bar.stop()
+                self.show_truncation_note()
         except RuntimeError:
             pass  # Handle possible Tkinter shutdown
     
+    def display_lines(self, text: str) -> None:
+        """Append lines to the results view, up to MAX_DISPLAY_LINES in total."""
+        room = MAX_DISPLAY_LINES - self.displayed_lines
+        count = text.count("\n")
+        if count > room:
+            # Keep only the lines that still fit; the rest stay in result_chunks
+            cut = 0
+            for _ in range(room):
+                cut = text.index("\n", cut) + 1
+            self.hidden_lines += count - room
+            text = text[:cut]
+            count = room
+        
+        if count:
+            self.text_area.configure(state=tk.NORMAL)
+            self.text_area.insert(tk.END, text)
+            self.text_area.configure(state=tk.DISABLED)
+            self.displayed_lines += count
+            self.schedule_autoscroll()
+    
+    def show_truncation_note(self) -> None:
+        """Tell the user how much of the tree was left out of the view."""
+        if self.hidden_lines:
+            self.text_area.configure(state=tk.NORMAL)
+            self.text_area.insert(tk.END, f"... truncated, {self.hidden_lines} more lines; "
+                                          f"use Copy Results to get the full tree\n")
+            self.text_area.configure(state=tk.DISABLED)
+            self.schedule_autoscroll()
+    
+    def schedule_autoscroll(self) -> None:
+        """Scroll the results to the end at most once per AUTOSCROLL_INTERVAL_MS."""
+        if not self.autoscroll_pending:
+            self.autoscroll_pending = True
+            self.root.after(AUTOSCROLL_INTERVAL_MS, self.flush_autoscroll)
+    
+    def flush_autoscroll(self) -> None:
+        """Run the deferred scroll requested by schedule_autoscroll."""
+        self.autoscroll_pending = False
+        self.text_area.see(tk.END)
+    
     def copy_results(self) -> None:
         """Copy results to clipboard."""
-        content = self.text_area.get(1.0, tk.END)
+        # The buffer also holds lines left out of a truncated view
+        content = "".join(self.result_chunks)
+        if not content:
+            content = self.text_area.get(1.0, tk.END)
         if content.strip():
             self.root.clipboard_clear()
             self.root.clipboard_append(content)
-            self.progress_var.set("Results copied to clipboard!")
-            self.root.after(2000, lambda: self.progress_var.set("Ready"))
+            self.flash_status("Results copied to clipboard!")
         else:
             messagebox.showwarning("Warning", "No results to copy.")
 
@@ -596,4 +916,5 @@ def main() -> None:
     root.mainloop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()